@@ -1,9 +1,8 @@
+import copy
 import random
 import string
 
 import pytest
-from selenium import webdriver
-from selenium.common.exceptions import WebDriverException
 
 
 def random_string(n):
@@ -21,10 +20,15 @@ def random_name(n):
     return "-".join([x.capitalize() for x in words])
 
 
-@pytest.yield_fixture(scope="session")
-def driver():
+@pytest.fixture(scope="session")
+def _driver():
+    from selenium import webdriver
+    from selenium.common.exceptions import WebDriverException
+
     chrome_options = webdriver.ChromeOptions()
     chrome_options.headless = True
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
     try:
         b = webdriver.Chrome(options=chrome_options)
     except WebDriverException as e:
@@ -35,12 +39,102 @@ def driver():
 
 
 @pytest.fixture
-def genres(db):
+def driver(_driver):
+    # The browser is shared by the whole session, only its state is reset.
+    yield _driver
+    _driver.delete_all_cookies()
+
+
+class Wait:
+    """
+    Wait for a condition in the browser.
+
+    Poll frequently for the common fast case and retry once with a longer
+    timeout for slow CI machines. Elements are located by CSS selector unless
+    another ``By`` attribute name is passed, e.g. ``by="XPATH"``.
+    """
+
+    def __init__(self, driver, timeout=10, poll_frequency=0.05):
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+
+    def until(self, method):
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support.wait import WebDriverWait
+
+        try:
+            return WebDriverWait(
+                self.driver, self.timeout, poll_frequency=self.poll_frequency
+            ).until(method)
+        except TimeoutException:
+            return WebDriverWait(
+                self.driver, self.timeout * 5, poll_frequency=self.poll_frequency * 4
+            ).until(method)
+
+    def _located(self, condition, selector, *args, by="CSS_SELECTOR"):
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions
+
+        locator = (getattr(By, by), selector)
+        return self.until(getattr(expected_conditions, condition)(locator, *args))
+
+    def present(self, selector, **kwargs):
+        return self._located("presence_of_element_located", selector, **kwargs)
+
+    def all_present(self, selector, **kwargs):
+        return self._located("presence_of_all_elements_located", selector, **kwargs)
+
+    def visible(self, selector, **kwargs):
+        return self._located("visibility_of_element_located", selector, **kwargs)
+
+    def clickable(self, selector, **kwargs):
+        return self._located("element_to_be_clickable", selector, **kwargs)
+
+    def text(self, selector, text, **kwargs):
+        return self._located("text_to_be_present_in_element", selector, text, **kwargs)
+
+
+@pytest.fixture
+def wait(driver):
+    return Wait(driver)
+
+
+@pytest.fixture(scope="session")
+def _genres(django_db_setup, django_db_blocker):
+    """
+    Insert the genres once per session.
+
+    The rows are committed outside of any test transaction, so they are
+    visible to every test until a transactional test flushes the table.
+    """
     from .testapp.models import Genre
 
-    return Genre.objects.bulk_create(
-        [Genre(pk=pk, title=random_string(50)) for pk in range(100)]
-    )
+    with django_db_blocker.unblock():
+        # rows left behind by an interrupted run would clash with the fixed pks
+        Genre.objects.all().delete()
+        genres = Genre.objects.bulk_create(
+            [Genre(pk=pk, title=random_string(50)) for pk in range(100)]
+        )
+    yield genres
+    with django_db_blocker.unblock():
+        Genre.objects.all().delete()
+
+
+@pytest.fixture
+def genres(db, _genres):
+    from .testapp.models import Genre
+
+    # transactional tests (e.g. live_server) flush the table
+    if not Genre.objects.exists():
+        Genre.objects.bulk_create(_genres)
+    # copies, so that changed attributes do not leak into other tests
+    return [copy.copy(genre) for genre in _genres]
+
+
+@pytest.fixture
+def last_genre(genres):
+    return genres[-1]
 
 
 @pytest.fixture
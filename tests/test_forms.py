@@ -7,14 +7,11 @@ from django.db.models import QuerySet
 from django.urls import reverse
 from django.utils import translation
 from django.utils.encoding import force_str
-from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions
-from selenium.webdriver.support.wait import WebDriverWait
 
 from django_select2.cache import cache
 from django_select2.conf import settings
 from django_select2.forms import (
+    HeavySelect2Mixin,
     HeavySelect2MultipleWidget,
     HeavySelect2Widget,
     ModelSelect2TagWidget,
@@ -27,140 +24,163 @@ from tests.testapp.forms import (
     HeavySelect2MultipleWidgetForm,
     TitleModelSelect2Widget,
 )
-from tests.testapp.models import Artist, City, Country, Genre, Groupie
+from tests.testapp.models import Artist, City, Genre, Groupie
+
+pytestmark = pytest.mark.django_db
+
+
+def select2_pick(driver, wait, select_id, value, text):
+    """Select an option via select2's jQuery API and wait for it to be rendered."""
+    driver.execute_script(
+        """
+        var $select = $(arguments[0]);
+        var data = {id: arguments[1], text: arguments[2]};
+        $select.append(new Option(data.text, data.id, true, true)).trigger("change");
+        $select.trigger({type: "select2:select", params: {data: data}});
+        """,
+        "#%s" % select_id,
+        str(value),
+        text,
+    )
+    wait.text("#select2-%s-container" % select_id, text)
+
+
+def assert_no_js_error(driver):
+    for error in driver.find_elements_by_xpath("//body[@JSError]"):
+        pytest.fail(error.get_attribute("JSError"))
+
+
+def select2_result_texts(driver):
+    """Return the texts of all open select2 results in a single WebDriver call."""
+    return driver.execute_script(
+        "return Array.from("
+        "document.querySelectorAll('.select2-results li')"
+        ").map(e => e.innerText);"
+    )
 
 
 class TestSelect2Mixin:
-    url = reverse("select2_widget")
-    form = forms.AlbumSelect2WidgetForm()
-    multiple_form = forms.AlbumSelect2MultipleWidgetForm()
-    widget_cls = Select2Widget
+    @pytest.fixture
+    def url(self):
+        return reverse("select2_widget")
+
+    @pytest.fixture
+    def form(self):
+        return forms.AlbumSelect2WidgetForm()
 
-    def test_initial_data(self, genres):
+    @pytest.fixture
+    def multiple_form(self):
+        return forms.AlbumSelect2MultipleWidgetForm()
+
+    def test_initial_data(self, form, genres):
         genre = genres[0]
-        form = self.form.__class__(initial={"primary_genre": genre.pk})
+        form = form.__class__(initial={"primary_genre": genre.pk})
         assert str(genre) in form.as_p()
 
-    def test_initial_form_class(self):
-        widget = self.widget_cls(attrs={"class": "my-class"})
-        assert "my-class" in widget.render("name", None)
-        assert "django-select2" in widget.render("name", None)
-
-    def test_allow_clear(self, db):
-        required_field = self.form.fields["artist"]
+    def test_allow_clear(self, form):
+        required_field = form.fields["artist"]
         assert required_field.required is True
-        assert 'data-allow-clear="true"' not in required_field.widget.render(
-            "artist", None
-        )
-        assert 'data-allow-clear="false"' in required_field.widget.render(
-            "artist", None
-        )
-        assert '<option value=""></option>' not in required_field.widget.render(
-            "artist", None
-        )
+        output = required_field.widget.render("artist", None)
+        select_tag = output[: output.index(">")]
+        assert 'data-allow-clear="true"' not in select_tag
+        assert 'data-allow-clear="false"' in select_tag
+        assert '<option value=""></option>' not in output
 
-        not_required_field = self.form.fields["primary_genre"]
+        not_required_field = form.fields["primary_genre"]
         assert not_required_field.required is False
-        assert 'data-allow-clear="true"' in not_required_field.widget.render(
-            "primary_genre", None
-        )
-        assert 'data-allow-clear="false"' not in not_required_field.widget.render(
-            "primary_genre", None
-        )
-        assert "data-placeholder" in not_required_field.widget.render(
-            "primary_genre", None
-        )
-        assert '<option value=""></option>' in not_required_field.widget.render(
-            "primary_genre", None
-        )
-
-    def test_no_js_error(self, db, live_server, driver):
-        driver.get(live_server + self.url)
-        with pytest.raises(NoSuchElementException):
-            error = driver.find_element_by_xpath("//body[@JSError]")
-            pytest.fail(error.get_attribute("JSError"))
-
-    def test_selecting(self, db, live_server, driver):
-        driver.get(live_server + self.url)
-        with pytest.raises(NoSuchElementException):
-            driver.find_element_by_css_selector(".select2-results")
-        elem = driver.find_element_by_css_selector(".select2-selection")
+        output = not_required_field.widget.render("primary_genre", None)
+        select_tag = output[: output.index(">")]
+        assert 'data-allow-clear="true"' in select_tag
+        assert 'data-allow-clear="false"' not in select_tag
+        assert "data-placeholder" in select_tag
+        assert (
+            '<option value=""></option>' in output
+            or '<option value="" selected></option>' in output
+        ), output
+
+    @pytest.mark.selenium
+    def test_no_js_error(self, live_server, driver, url, wait):
+        driver.get(live_server + url)
+        wait.present(".select2-selection")
+        assert_no_js_error(driver)
+
+    @pytest.mark.selenium
+    def test_selecting(self, live_server, driver, url, wait):
+        driver.get(live_server + url)
+        elem = wait.clickable(".select2-selection")
+        assert not driver.find_elements_by_css_selector(".select2-results")
         elem.click()
-        results = driver.find_element_by_css_selector(".select2-results")
+        results = wait.visible(".select2-results")
         assert results.is_displayed() is True
         elem = results.find_element_by_css_selector(".select2-results__option")
         elem.click()
 
-        with pytest.raises(NoSuchElementException):
-            error = driver.find_element_by_xpath("//body[@JSError]")
-            pytest.fail(error.get_attribute("JSError"))
-
-    def test_data_url(self):
-        with pytest.raises(ValueError):
-            HeavySelect2Widget()
-
-        widget = HeavySelect2Widget(data_url="/foo/bar")
-        assert widget.get_url() == "/foo/bar"
+        assert_no_js_error(driver)
 
-    def test_empty_option(self, db):
+    def test_empty_option(self, form, multiple_form):
         # Empty options is only required for single selects
         # https://select2.github.io/options.html#allowClear
-        single_select = self.form.fields["primary_genre"]
+        single_select = form.fields["primary_genre"]
         assert single_select.required is False
-        assert '<option value=""></option>' in single_select.widget.render(
-            "primary_genre", None
-        )
+        output = single_select.widget.render("primary_genre", None)
+        assert (
+            '<option value=""></option>' in output
+            or '<option value="" selected></option>' in output
+        ), output
 
-        multiple_select = self.multiple_form.fields["featured_artists"]
+        multiple_select = multiple_form.fields["featured_artists"]
         assert multiple_select.required is False
         assert multiple_select.widget.allow_multiple_selected
         output = multiple_select.widget.render("featured_artists", None)
         assert '<option value=""></option>' not in output
         assert 'data-placeholder=""' in output
 
-    def test_i18n(self):
-        translation.activate("de")
-        assert tuple(Select2Widget().media._js) == (
-            f"https://cdnjs.cloudflare.com/ajax/libs/select2/{settings.SELECT2_LIB_VERSION}/js/select2.min.js",
-            f"https://cdnjs.cloudflare.com/ajax/libs/select2/{settings.SELECT2_LIB_VERSION}/js/i18n/de.js",
-            "django_select2/django_select2.js",
-        )
-
-        translation.activate("en")
-        assert tuple(Select2Widget().media._js) == (
-            f"https://cdnjs.cloudflare.com/ajax/libs/select2/{settings.SELECT2_LIB_VERSION}/js/select2.min.js",
-            f"https://cdnjs.cloudflare.com/ajax/libs/select2/{settings.SELECT2_LIB_VERSION}/js/i18n/en.js",
-            "django_select2/django_select2.js",
-        )
-
-        translation.activate("00")
-        assert tuple(Select2Widget().media._js) == (
-            f"https://cdnjs.cloudflare.com/ajax/libs/select2/{settings.SELECT2_LIB_VERSION}/js/select2.min.js",
-            "django_select2/django_select2.js",
-        )
-
-        translation.activate("sr-cyrl")
-        assert tuple(Select2Widget().media._js) == (
-            f"https://cdnjs.cloudflare.com/ajax/libs/select2/{settings.SELECT2_LIB_VERSION}/js/select2.min.js",
-            f"https://cdnjs.cloudflare.com/ajax/libs/select2/{settings.SELECT2_LIB_VERSION}/js/i18n/sr-Cyrl.js",
-            "django_select2/django_select2.js",
-        )
-
-        pytest.importorskip("django", minversion="2.0.4")
 
-        translation.activate("zh-hans")
-        assert tuple(Select2Widget().media._js) == (
-            f"https://cdnjs.cloudflare.com/ajax/libs/select2/{settings.SELECT2_LIB_VERSION}/js/select2.min.js",
-            f"https://cdnjs.cloudflare.com/ajax/libs/select2/{settings.SELECT2_LIB_VERSION}/js/i18n/zh-CN.js",
-            "django_select2/django_select2.js",
-        )
-
-        translation.activate("zh-hant")
-        assert tuple(Select2Widget().media._js) == (
-            f"https://cdnjs.cloudflare.com/ajax/libs/select2/{settings.SELECT2_LIB_VERSION}/js/select2.min.js",
-            f"https://cdnjs.cloudflare.com/ajax/libs/select2/{settings.SELECT2_LIB_VERSION}/js/i18n/zh-TW.js",
-            "django_select2/django_select2.js",
-        )
+@pytest.mark.parametrize(
+    "widget_cls,widget_kwargs",
+    [
+        (Select2Widget, {}),
+        (HeavySelect2Widget, {"data_view": "heavy_data_1"}),
+        (ModelSelect2Widget, {"model": Genre, "search_fields": ["title__icontains"]}),
+        (
+            ModelSelect2TagWidget,
+            {"model": Genre, "search_fields": ["title__icontains"]},
+        ),
+    ],
+    scope="class",
+)
+class TestWidgetCommon:
+    @pytest.fixture
+    def widget(self, widget_cls, widget_kwargs):
+        return widget_cls(attrs={"class": "my-class"}, **widget_kwargs)
+
+    def test_initial_form_class(self, widget, widget_cls):
+        output = widget.render("name", None)
+        assert "my-class" in output
+        assert "django-select2" in output
+        if issubclass(widget_cls, HeavySelect2Mixin):
+            assert "django-select2-heavy" in output, output
+
+    @pytest.mark.parametrize(
+        "lang,i18n_file",
+        [
+            ("de", "de.js"),
+            ("en", "en.js"),
+            ("00", None),
+            ("sr-cyrl", "sr-Cyrl.js"),
+            ("zh-hans", "zh-CN.js"),
+            ("zh-hant", "zh-TW.js"),
+        ],
+    )
+    def test_i18n(self, widget, lang, i18n_file):
+        cdn = f"https://cdnjs.cloudflare.com/ajax/libs/select2/{settings.SELECT2_LIB_VERSION}/js"
+        i18n_js = (f"{cdn}/i18n/{i18n_file}",) if i18n_file else ()
+        with translation.override(lang):
+            assert tuple(widget.media._js) == (
+                f"{cdn}/select2.min.js",
+                *i18n_js,
+                "django_select2/django_select2.js",
+            )
 
 
 class TestSelect2MixinSettings:
@@ -177,6 +197,12 @@ class TestSelect2MixinSettings:
         )
         assert "django_select2/django_select2.js" in result
 
+    def test_i18n_available_languages_setting(self, settings):
+        with translation.override("de"):
+            assert any(js.endswith("/de.js") for js in Select2Widget().media._js)
+            settings.SELECT2_I18N_AVAILABLE_LANGUAGES = ["en"]
+            assert not any(js.endswith("/de.js") for js in Select2Widget().media._js)
+
     def test_js_setting(self, settings):
         settings.SELECT2_JS = "alternate.js"
         sut = Select2Widget()
@@ -204,123 +230,109 @@ class TestSelect2MixinSettings:
 
 
 class TestHeavySelect2Mixin(TestSelect2Mixin):
-    url = reverse("heavy_select2_widget")
-    form = forms.HeavySelect2WidgetForm(initial={"primary_genre": 1})
     widget_cls = HeavySelect2Widget
 
-    def test_initial_data(self):
-        assert "One" in self.form.as_p()
+    @pytest.fixture
+    def url(self):
+        return reverse("heavy_select2_widget")
 
-    def test_initial_form_class(self):
-        widget = self.widget_cls(data_view="heavy_data_1", attrs={"class": "my-class"})
-        assert "my-class" in widget.render("name", None)
-        assert "django-select2" in widget.render("name", None)
-        assert "django-select2-heavy" in widget.render("name", None), widget.render(
-            "name", None
-        )
+    @pytest.fixture
+    def form(self):
+        return forms.HeavySelect2WidgetForm(initial={"primary_genre": 1})
+
+    @pytest.fixture
+    def default_widget(self):
+        return self.widget_cls(data_view="heavy_data_1", attrs={"class": "my-class"})
 
-    def test_selected_option(self, db):
-        not_required_field = self.form.fields["primary_genre"]
+    def test_initial_data(self, form):
+        assert "One" in form.as_p()
+
+    def test_selected_option(self, form):
+        not_required_field = form.fields["primary_genre"]
         assert not_required_field.required is False
-        assert '<option value="1" selected="selected">One</option>' in not_required_field.widget.render(
-            "primary_genre", 1
-        ) or '<option value="1" selected>One</option>' in not_required_field.widget.render(
-            "primary_genre", 1
-        ), not_required_field.widget.render(
-            "primary_genre", 1
-        )
+        output = not_required_field.widget.render("primary_genre", 1)
+        assert (
+            '<option value="1" selected="selected">One</option>' in output
+            or '<option value="1" selected>One</option>' in output
+        ), output
 
-    def test_many_selected_option(self, db, genres):
+    def test_many_selected_option(self, genres):
         field = HeavySelect2MultipleWidgetForm().fields["genres"]
         field.widget.choices = NUMBER_CHOICES
         widget_output = field.widget.render("genres", [1, 2])
-        selected_option = '<option value="{pk}" selected="selected">{value}</option>'.format(
-            pk=1, value="One"
-        )
-        selected_option_a = '<option value="{pk}" selected>{value}</option>'.format(
-            pk=1, value="One"
-        )
-        selected_option2 = '<option value="{pk}" selected="selected">{value}</option>'.format(
-            pk=2, value="Two"
-        )
-        selected_option2a = '<option value="{pk}" selected>{value}</option>'.format(
-            pk=2, value="Two"
-        )
+        selected_option = '<option value="1" selected="selected">One</option>'
+        selected_option_a = '<option value="1" selected>One</option>'
+        selected_option2 = '<option value="2" selected="selected">Two</option>'
+        selected_option2a = '<option value="2" selected>Two</option>'
 
         assert (
             selected_option in widget_output or selected_option_a in widget_output
         ), widget_output
         assert selected_option2 in widget_output or selected_option2a in widget_output
 
-    def test_multiple_widgets(self, db, live_server, driver):
-        driver.get(live_server + self.url)
-        with pytest.raises(NoSuchElementException):
-            driver.find_element_by_css_selector(".select2-results")
-
-        elem1, elem2 = driver.find_elements_by_css_selector(".select2-selection")
+    @pytest.mark.selenium
+    def test_multiple_widgets(self, live_server, driver, url, wait):
+        driver.get(live_server + url)
+        elem1, elem2 = wait.all_present(".select2-selection")
+        assert not driver.find_elements_by_css_selector(".select2-results")
 
         elem1.click()
         search1 = driver.find_element_by_css_selector(".select2-search__field")
         search1.send_keys("fo")
-        result1 = (
-            WebDriverWait(driver, 60)
-            .until(
-                expected_conditions.presence_of_element_located(
-                    (By.CSS_SELECTOR, ".select2-results li:first-child")
-                )
-            )
-            .text
-        )
+        result1 = wait.present(".select2-results li:first-child").text
 
         elem2.click()
         search2 = driver.find_element_by_css_selector(".select2-search__field")
         search2.send_keys("fo")
-        result2 = (
-            WebDriverWait(driver, 60)
-            .until(
-                expected_conditions.presence_of_element_located(
-                    (By.CSS_SELECTOR, ".select2-results li:first-child")
-                )
-            )
-            .text
-        )
+        result2 = wait.present(".select2-results li:first-child").text
 
         assert result1 != result2
 
-        with pytest.raises(NoSuchElementException):
-            error = driver.find_element_by_xpath("//body[@JSError]")
-            pytest.fail(error.get_attribute("JSError"))
+        assert_no_js_error(driver)
 
-    def test_get_url(self):
-        widget = self.widget_cls(data_view="heavy_data_1", attrs={"class": "my-class"})
-        assert isinstance(widget.get_url(), str)
+    def test_data_url(self):
+        with pytest.raises(ValueError):
+            HeavySelect2Widget()
 
-    def test_can_not_pickle(self):
-        widget = self.widget_cls(data_view="heavy_data_1", attrs={"class": "my-class"})
+        widget = HeavySelect2Widget(data_url="/foo/bar")
+        assert widget.get_url() == "/foo/bar"
 
+    def test_get_url(self, default_widget):
+        assert isinstance(default_widget.get_url(), str)
+
+    def test_can_not_pickle(self, default_widget):
         class NoPickle:
             pass
 
-        widget.no_pickle = NoPickle()
+        default_widget.no_pickle = NoPickle()
         with pytest.raises(NotImplementedError):
-            widget.set_to_cache()
+            default_widget.set_to_cache()
+
 
+class TestModelSelect2Mixin(TestSelect2Mixin):
+    @pytest.fixture
+    def url(self):
+        return reverse("model_select2_widget")
 
-class TestModelSelect2Mixin(TestHeavySelect2Mixin):
-    form = forms.AlbumModelSelect2WidgetForm(initial={"primary_genre": 1})
-    multiple_form = forms.ArtistModelSelect2MultipleWidgetForm()
+    @pytest.fixture
+    def form(self):
+        return forms.AlbumModelSelect2WidgetForm(initial={"primary_genre": 1})
 
-    def test_initial_data(self, genres):
+    @pytest.fixture
+    def multiple_form(self):
+        return forms.ArtistModelSelect2MultipleWidgetForm()
+
+    def test_initial_data(self, form, genres):
         genre = genres[0]
-        form = self.form.__class__(initial={"primary_genre": genre.pk})
+        form = form.__class__(initial={"primary_genre": genre.pk})
         assert str(genre) in form.as_p()
 
-    def test_label_from_instance_initial(self, genres):
+    def test_label_from_instance_initial(self, form, genres):
         genre = genres[0]
         genre.title = genre.title.lower()
         genre.save()
 
-        form = self.form.__class__(initial={"primary_genre": genre.pk})
+        form = form.__class__(initial={"primary_genre": genre.pk})
         assert genre.title not in form.as_p(), form.as_p()
         assert genre.title.upper() in form.as_p()
 
@@ -328,43 +340,37 @@ class TestModelSelect2Mixin(TestHeavySelect2Mixin):
     def genres(self, genres):
         return genres
 
-    def test_selected_option(self, db, genres):
+    def test_selected_option(self, form, genres):
         genre = genres[0]
         genre2 = genres[1]
-        not_required_field = self.form.fields["primary_genre"]
+        not_required_field = form.fields["primary_genre"]
         assert not_required_field.required is False
         widget_output = not_required_field.widget.render("primary_genre", genre.pk)
-        selected_option = '<option value="{pk}" selected="selected">{value}</option>'.format(
-            pk=genre.pk, value=force_str(genre)
-        )
-        selected_option_a = '<option value="{pk}" selected>{value}</option>'.format(
-            pk=genre.pk, value=force_str(genre)
-        )
-        unselected_option = '<option value="{pk}">{value}</option>'.format(
-            pk=genre2.pk, value=force_str(genre2)
+        value = force_str(genre)
+        selected_option = (
+            f'<option value="{genre.pk}" selected="selected">{value}</option>'
         )
+        selected_option_a = f'<option value="{genre.pk}" selected>{value}</option>'
+        unselected_option = f'<option value="{genre2.pk}">{force_str(genre2)}</option>'
 
         assert (
             selected_option in widget_output or selected_option_a in widget_output
         ), widget_output
         assert unselected_option not in widget_output
 
-    def test_selected_option_label_from_instance(self, db, genres):
+    def test_selected_option_label_from_instance(self, form, genres):
         genre = genres[0]
         genre.title = genre.title.lower()
         genre.save()
 
-        field = self.form.fields["primary_genre"]
+        field = form.fields["primary_genre"]
         widget_output = field.widget.render("primary_genre", genre.pk)
 
         def get_selected_options(genre):
+            value = force_str(genre)
             return (
-                '<option value="{pk}" selected="selected">{value}</option>'.format(
-                    pk=genre.pk, value=force_str(genre)
-                ),
-                '<option value="{pk}" selected>{value}</option>'.format(
-                    pk=genre.pk, value=force_str(genre)
-                ),
+                f'<option value="{genre.pk}" selected="selected">{value}</option>',
+                f'<option value="{genre.pk}" selected>{value}</option>',
             )
 
         assert all(o not in widget_output for o in get_selected_options(genre))
@@ -429,46 +435,65 @@ class TestModelSelect2Mixin(TestHeavySelect2Mixin):
         assert isinstance(widget.get_search_fields(), Iterable)
         assert all(isinstance(x, str) for x in widget.get_search_fields())
 
-    def test_filter_queryset(self, genres):
-        widget = TitleModelSelect2Widget(queryset=Genre.objects.all())
-        assert widget.filter_queryset(None, genres[0].title[:3]).exists()
-
-        widget = TitleModelSelect2Widget(
-            search_fields=["title__icontains"], queryset=Genre.objects.all()
-        )
-        qs = widget.filter_queryset(
-            None, " ".join([genres[0].title[:3], genres[0].title[3:]])
-        )
-        assert qs.exists()
-
-    def test_model_kwarg(self):
+    @pytest.mark.parametrize(
+        "search_fields,get_term,expected",
+        [
+            (None, lambda t: t[:3], True),
+            (["title__icontains"], lambda t: " ".join([t[:3], t[3:]]), True),
+            (["title__istartswith"], lambda t: t.lower(), True),
+            (["title__iexact"], lambda t: t[:3], False),
+            (["title__iexact", "title__istartswith"], lambda t: t[:3], True),
+        ],
+        ids=["default", "multiple_terms", "startswith", "exact", "multiple_fields"],
+    )
+    def test_filter_queryset(
+        self, genres, django_assert_max_num_queries, search_fields, get_term, expected
+    ):
+        # None keeps the widget's class-level search_fields
+        kwargs = {"search_fields": search_fields} if search_fields else {}
+        widget = TitleModelSelect2Widget(queryset=Genre.objects.all(), **kwargs)
+        qs = widget.filter_queryset(None, get_term(genres[0].title))
+        with django_assert_max_num_queries(1):
+            assert qs.exists() is expected
+
+    def test_model_kwarg(self, last_genre, django_assert_num_queries):
         widget = ModelSelect2Widget(model=Genre, search_fields=["title__icontains"])
-        genre = Genre.objects.last()
-        result = widget.filter_queryset(None, genre.title)
-        assert result.exists()
+        with django_assert_num_queries(1):
+            result = widget.filter_queryset(None, last_genre.title)
+            assert result.exists()
 
-    def test_queryset_kwarg(self):
+    def test_queryset_kwarg(self, last_genre, django_assert_num_queries):
         widget = ModelSelect2Widget(
             queryset=Genre.objects.all(), search_fields=["title__icontains"]
         )
-        genre = Genre.objects.last()
-        result = widget.filter_queryset(None, genre.title)
-        assert result.exists()
+        with django_assert_num_queries(1):
+            result = widget.filter_queryset(None, last_genre.title)
+            assert result.exists()
 
-    def test_ajax_view_registration(self, client):
+    def test_ajax_view_registration(
+        self, client, last_genre, django_assert_num_queries
+    ):
         widget = ModelSelect2Widget(
             queryset=Genre.objects.all(), search_fields=["title__icontains"]
         )
-        widget.render("name", "value")
+        widget.set_to_cache()
         url = reverse("django_select2:auto-json")
-        genre = Genre.objects.last()
-        response = client.get(
-            url, data=dict(field_id=widget.field_id, term=genre.title)
-        )
+        # one COUNT query for the paginator and one for the page itself
+        with django_assert_num_queries(2):
+            response = client.get(
+                url, data=dict(field_id=widget.field_id, term=last_genre.title)
+            )
         assert response.status_code == 200, response.content
         data = json.loads(response.content.decode("utf-8"))
         assert data["results"]
-        assert genre.pk in [result["id"] for result in data["results"]]
+        assert last_genre.pk in [result["id"] for result in data["results"]]
+
+    def test_cache_key_leak(self):
+        bob = TitleModelSelect2Widget(queryset=Genre.objects.all())
+        alice = TitleModelSelect2Widget(queryset=Genre.objects.all())
+        assert bob._get_cache_key() == bob._get_cache_key()
+        assert bob._get_cache_key() != alice._get_cache_key()
+        assert cache.get(bob._get_cache_key()) is None
 
     def test_render(self):
         widget = ModelSelect2Widget(queryset=Genre.objects.all())
@@ -492,10 +517,10 @@ class TestModelSelect2Mixin(TestHeavySelect2Mixin):
         form = forms.GroupieForm(instance=groupie)
         assert '<option value="Take That" selected>TAKE THAT</option>' in form.as_p()
 
-    def test_empty_label(self, db):
+    def test_empty_label(self, form):
         # Empty options is only required for single selects
         # https://select2.github.io/options.html#allowClear
-        single_select = self.form.fields["primary_genre"]
+        single_select = form.fields["primary_genre"]
         single_select.empty_label = "Hello World"
         assert single_select.required is False
         assert 'data-placeholder="Hello World"' in single_select.widget.render(
@@ -503,7 +528,7 @@ class TestModelSelect2Mixin(TestHeavySelect2Mixin):
         )
 
 
-class TestHeavySelect2TagWidget(TestHeavySelect2Mixin):
+class TestHeavySelect2TagWidget:
     def test_tag_attrs(self):
         widget = ModelSelect2TagWidget(
             queryset=Genre.objects.all(), search_fields=["title__icontains"]
@@ -524,20 +549,22 @@ class TestHeavySelect2TagWidget(TestHeavySelect2Mixin):
 
 
 class TestHeavySelect2MultipleWidget:
-    url = reverse("heavy_select2_multiple_widget")
-    form = forms.HeavySelect2MultipleWidgetForm()
     widget_cls = HeavySelect2MultipleWidget
 
+    @pytest.fixture
+    def url(self):
+        return reverse("heavy_select2_multiple_widget")
+
+    @pytest.mark.selenium
     @pytest.mark.xfail(
         bool(os.environ.get("CI", False)),
         reason="https://bugs.chromium.org/p/chromedriver/issues/detail?id=1772",
     )
-    def test_widgets_selected_after_validation_error(self, db, live_server, driver):
-        driver.get(live_server + self.url)
-        WebDriverWait(driver, 3).until(
-            expected_conditions.presence_of_element_located((By.ID, "id_title"))
-        )
-        title = driver.find_element_by_id("id_title")
+    def test_widgets_selected_after_validation_error(
+        self, live_server, driver, url, wait
+    ):
+        driver.get(live_server + url)
+        title = wait.present("#id_title")
         title.send_keys("fo")
         genres, fartists = driver.find_elements_by_css_selector(
             ".select2-selection--multiple"
@@ -548,15 +575,7 @@ class TestHeavySelect2MultipleWidget:
         driver.find_element_by_css_selector(".select2-results li:nth-child(2)").click()
         genres.submit()
         # there is a ValidationError raised, check for it
-        errstring = (
-            WebDriverWait(driver, 3)
-            .until(
-                expected_conditions.presence_of_element_located(
-                    (By.CSS_SELECTOR, "ul.errorlist li")
-                )
-            )
-            .text
-        )
+        errstring = wait.present("ul.errorlist li").text
         assert errstring == "Title must have more than 3 characters."
         # genres should still have One as selected option
         result_title = driver.find_element_by_css_selector(
@@ -566,19 +585,17 @@ class TestHeavySelect2MultipleWidget:
 
 
 class TestAddressChainedSelect2Widget:
-    url = reverse("model_chained_select2_widget")
-    form = forms.AddressChainedSelect2WidgetForm()
+    @pytest.fixture
+    def url(self):
+        return reverse("model_chained_select2_widget")
 
+    @pytest.mark.selenium
     def test_widgets_selected_after_validation_error(
-        self, db, live_server, driver, countries, cities
+        self, live_server, driver, url, wait, countries, cities
     ):
-        driver.get(live_server + self.url)
+        driver.get(live_server + url)
 
-        WebDriverWait(driver, 60).until(
-            expected_conditions.presence_of_element_located(
-                (By.CSS_SELECTOR, ".select2-selection--single")
-            )
-        )
+        wait.present(".select2-selection--single")
         (
             country_container,
             city_container,
@@ -587,124 +604,69 @@ class TestAddressChainedSelect2Widget:
 
         # clicking city select2 lists all available cities
         city_container.click()
-        WebDriverWait(driver, 60).until(
-            expected_conditions.presence_of_element_located(
-                (By.CSS_SELECTOR, ".select2-results li")
-            )
-        )
-        city_options = driver.find_elements_by_css_selector(".select2-results li")
-        city_names_from_browser = {option.text for option in city_options}
+        wait.present(".select2-results li")
+        city_names_from_browser = set(select2_result_texts(driver))
         city_names_from_db = set(City.objects.values_list("name", flat=True))
-        assert len(city_names_from_browser) == City.objects.count()
+        assert len(city_names_from_browser) == len(cities)
         assert city_names_from_browser == city_names_from_db
 
         # selecting a country really does it
         country_container.click()
-        WebDriverWait(driver, 60).until(
-            expected_conditions.presence_of_element_located(
-                (By.CSS_SELECTOR, ".select2-results li:nth-child(2)")
-            )
-        )
-        country_option = driver.find_element_by_css_selector(
-            ".select2-results li:nth-child(2)"
-        )
+        country_option = wait.present(".select2-results li:nth-child(2)")
         country_name = country_option.text
         country_option.click()
         assert country_name == country_container.text
 
         # clicking city select2 lists reduced list of cities belonging to the country
         city_container.click()
-        WebDriverWait(driver, 60).until(
-            expected_conditions.presence_of_element_located(
-                (By.CSS_SELECTOR, ".select2-results li")
-            )
-        )
-        city_options = driver.find_elements_by_css_selector(".select2-results li")
-        city_names_from_browser = {option.text for option in city_options}
+        wait.present(".select2-results li")
+        city_names_from_browser = set(select2_result_texts(driver))
         city_names_from_db = set(
-            Country.objects.get(name=country_name).cities.values_list("name", flat=True)
+            City.objects.filter(country__name=country_name).values_list(
+                "name", flat=True
+            )
         )
-        assert len(city_names_from_browser) != City.objects.count()
+        assert len(city_names_from_browser) != len(cities)
         assert city_names_from_browser == city_names_from_db
 
         # selecting a city reaaly does it
-        city_option = driver.find_element_by_css_selector(
-            ".select2-results li:nth-child(2)"
-        )
+        city_option = wait.present(".select2-results li:nth-child(2)")
         city_name = city_option.text
         city_option.click()
         assert city_name == city_container.text
 
         # clicking country select2 lists reduced list to the only country available to the city
         country_container.click()
-        WebDriverWait(driver, 60).until(
-            expected_conditions.presence_of_element_located(
-                (By.CSS_SELECTOR, ".select2-results li")
-            )
-        )
-        country_options = driver.find_elements_by_css_selector(".select2-results li")
-        country_names_from_browser = {option.text for option in country_options}
-        country_names_from_db = {City.objects.get(name=city_name).country.name}
-        assert len(country_names_from_browser) != Country.objects.count()
+        wait.present(".select2-results li")
+        country_names_from_browser = set(select2_result_texts(driver))
+        country_names_from_db = {
+            City.objects.values_list("country__name", flat=True).get(name=city_name)
+        }
+        assert len(country_names_from_browser) != len(countries)
         assert country_names_from_browser == country_names_from_db
 
+    @pytest.mark.selenium
     def test_dependent_fields_clear_after_change_parent(
-        self, db, live_server, driver, countries, cities
+        self, live_server, driver, url, wait, countries, cities
     ):
-        driver.get(live_server + self.url)
-        (
-            country_container,
-            city_container,
-            city2_container,
-        ) = driver.find_elements_by_css_selector(".select2-selection--single")
-
-        # selecting a country really does it
-        country_container.click()
-        WebDriverWait(driver, 60).until(
-            expected_conditions.presence_of_element_located(
-                (By.CSS_SELECTOR, ".select2-results li:nth-child(2)")
-            )
-        )
-        country_option = driver.find_element_by_css_selector(
-            ".select2-results li:nth-child(2)"
-        )
-        country_name = country_option.text
-        country_option.click()
-        assert country_name == country_container.text
+        city2 = cities[0]
+        country = city2.country
+        other_country = next(c for c in countries if c.pk != country.pk)
+        driver.get(live_server + url)
+        country_container = wait.present("#select2-id_country-container")
 
-        # selecting a city2
-        city2_container.click()
-        WebDriverWait(driver, 60).until(
-            expected_conditions.presence_of_element_located(
-                (By.CSS_SELECTOR, ".select2-results li")
-            )
-        )
-        city2_option = driver.find_element_by_css_selector(
-            ".select2-results li:nth-child(2)"
-        )
-        city2_name = city2_option.text
-        city2_option.click()
-        assert city2_name == city2_container.text
+        select2_pick(driver, wait, "id_country", country.pk, country.name)
+        select2_pick(driver, wait, "id_city2", city2.pk, city2.name)
 
-        # change a country
+        # change the country through the UI
         country_container.click()
-        WebDriverWait(driver, 60).until(
-            expected_conditions.presence_of_element_located(
-                (By.CSS_SELECTOR, ".select2-results li:nth-child(3)")
-            )
-        )
-        country_option = driver.find_element_by_css_selector(
-            ".select2-results li:nth-child(3)"
-        )
-        country_name = country_option.text
-        country_option.click()
-        assert country_name == country_container.text
+        wait.clickable(
+            "//li[contains(@class, 'select2-results__option') and text()='%s']"
+            % other_country.name,
+            by="XPATH",
+        ).click()
+        assert country_container.text == other_country.name
 
         # check the value in city2
-        city2_container.click()
-        WebDriverWait(driver, 60).until(
-            expected_conditions.presence_of_element_located(
-                (By.CSS_SELECTOR, ".select2-results li")
-            )
-        )
+        city2_container = driver.find_element_by_id("select2-id_city2-container")
         assert city2_container.text == ""